@@ -8,6 +8,7 @@ import plotly.express as px
 from datetime import datetime
 import time
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Load environment variables
 load_dotenv()
@@ -31,6 +32,28 @@ st.set_page_config(
 # The custom CSS for gradients and glassmorphism is removed
 # to allow Streamlit's native themes to work.
 
+# ===== COMPARATIVE MODE SETTINGS =====
+MAX_COMPARE_TOPICS = 5
+
+# Sub-queries that are the same for every topic in a comparison.
+# These are researched once for the whole set instead of once per topic.
+SHARED_SUBQUERIES = [
+    "Latest developments and market trends (2024-2025) across this space",
+    "Overall market size, growth projections, and key statistics",
+    "Key players, stakeholders, and the competitive landscape",
+    "Market-wide challenges, opportunities, and risks",
+    "Future outlook and predictions for the space",
+]
+
+# Sub-queries that only make sense for a single topic.
+TOPIC_SUBQUERIES = [
+    "Topic-specific statistics, data points, and adoption figures",
+    "Core capabilities and differentiators",
+    "Expert opinions and perspectives specific to this topic",
+    "Strengths and weaknesses relative to the other topics",
+    "Ideal use cases and typical adopters",
+]
+
 # ===== HELPER FUNCTIONS =====
 def clean_markdown_text(text):
     """Remove markdown symbols from text"""
@@ -58,6 +81,59 @@ def detect_category(topic):
             return cat
     return 'general'
 
+def parse_topics(raw_text):
+    """Split one-topic-per-line input, dropping blanks and duplicates"""
+    topics = []
+    seen = set()
+    for line in raw_text.splitlines():
+        topic = ' '.join(line.split())
+        if topic and topic.lower() not in seen:
+            seen.add(topic.lower())
+            topics.append(topic)
+    return topics
+
+def format_subqueries(subqueries):
+    """Render sub-queries as a numbered prompt list"""
+    return '\n'.join(f"{idx}. {query}" for idx, query in enumerate(subqueries, 1))
+
+def run_topic_pipeline(model, topic, topics):
+    """Run the topic-specific Research and Analysis steps for one topic"""
+    others = ', '.join(t for t in topics if t != topic)
+    
+    research_prompt = f"""You are a Senior Research Analyst. Research: {topic}
+This is one option in a comparison with: {others}
+
+The market-wide background (trends, market size, key players, market risks, outlook)
+has already been researched for all topics. Do not repeat it.
+Focus only on what is specific to {topic}.
+
+Provide:
+{format_subqueries(TOPIC_SUBQUERIES)}
+
+Use clear sections and bullet points. Avoid using markdown symbols like # ** in your response."""
+    research = model.generate_content(research_prompt).text
+    
+    analysis_prompt = f"""You are a Data Analysis Expert. Analyze: {topic}
+Compare it against: {others}
+
+Provide:
+1. Critical insights and key findings
+2. SWOT analysis (Strengths, Weaknesses, Opportunities, Threats)
+3. Competitive position relative to the other topics
+4. Risk assessment
+5. When to choose {topic} over the alternatives
+
+Be analytical, specific, and actionable. Write in plain text without markdown symbols.
+
+Context:
+{research}"""
+    analysis = model.generate_content(analysis_prompt).text
+    
+    return research, analysis
+
+# Categories with their own charts in create_market_trends; all others get the general charts
+CHART_CATEGORIES = ('technology', 'healthcare', 'finance')
+
 def create_market_trends(category, topic):
     """Create advanced market trend visualizations"""
     charts = []
@@ -267,6 +343,7 @@ with st.container(border=True): # Using a standard Streamlit container
             "🎯 **Keyword Analysis:** Automatically extracts and ranks top keywords.",
             "📄 **Professional Reports:** Creates structured reports with key sections.",
             "💾 **Multiple Formats:** Download reports as Markdown or TXT.",
+            "⚖️ **Comparative Mode:** Compare up to five related topics in one report.",
             "🔄 **Live Updates:** (Simulated processing for agent steps)."
         ]
         for feature in features:
@@ -275,13 +352,28 @@ with st.container(border=True): # Using a standard Streamlit container
 # ===== MAIN CONFIGURATION =====
 st.subheader("📝 Research Configuration")
 with st.container(border=True):
+    research_mode = st.radio(
+        "Research Mode",
+        ["🎯 Single Topic", "⚖️ Comparative"],
+        horizontal=True,
+        help="Comparative mode researches shared background once and compares several topics in one report."
+    )
+    comparative_mode = research_mode == "⚖️ Comparative"
+    
     col1, col2, col3 = st.columns([3, 2, 1])
     with col1:
-        research_topic = st.text_input(
-            "🎯 Research Topic",
-            placeholder="e.g., Quantum Computing in Healthcare 2025"
-        )
-        st.caption("💡 Be specific for better and more detailed results")
+        if comparative_mode:
+            research_topic = st.text_area(
+                "⚖️ Topics to Compare (one per line)",
+                placeholder="e.g.,\nSolid-State Batteries\nLithium Iron Phosphate Batteries\nSodium-Ion Batteries"
+            )
+            st.caption(f"💡 Enter 2 to {MAX_COMPARE_TOPICS} related topics in the same market")
+        else:
+            research_topic = st.text_input(
+                "🎯 Research Topic",
+                placeholder="e.g., Quantum Computing in Healthcare 2025"
+            )
+            st.caption("💡 Be specific for better and more detailed results")
     with col2:
         detail_level = st.selectbox(
             "Detail Level",
@@ -294,7 +386,202 @@ with st.container(border=True):
 
 
 # ===== RESEARCH BUTTON =====
-if st.button("🚀 START AI RESEARCH", use_container_width=True, type="primary"):
+start_research = st.button("🚀 START AI RESEARCH", use_container_width=True, type="primary")
+
+# ===== COMPARATIVE RESEARCH =====
+if start_research and comparative_mode:
+    topics = parse_topics(research_topic or "")
+    if len(topics) < 2:
+        st.error("⚠️ Please enter at least two different topics to compare!")
+        st.stop()
+    if len(topics) > MAX_COMPARE_TOPICS:
+        st.error(f"⚠️ Please enter at most {MAX_COMPARE_TOPICS} topics!")
+        st.stop()
+    
+    topic_list = ', '.join(topics)
+    
+    st.markdown("---")
+    
+    # Initialize model
+    model = genai.GenerativeModel('gemini-pro-latest')
+    
+    # Create tabs
+    tab1, tab2, tab3, tab4 = st.tabs(["🌐 Shared Background", "🔍 Topic Research", "✍️ Comparative Report", "📈 Market Trends"])
+    
+    shared_background = ""
+    topic_results = {}
+    comparative_report = ""
+    
+    # ===== SHARED BACKGROUND PHASE =====
+    with tab1:
+        st.subheader("🌐 Shared Background")
+        status_text = st.empty()
+        status_text.info("🔄 Researching background shared by all topics...")
+        
+        with st.spinner("🔍 Research Agent gathering shared market context..."):
+            try:
+                background_prompt = f"""You are a Senior Research Analyst. Provide the shared market background for a comparison of: {topic_list}
+
+Cover only context that is common to all of these topics. Do not profile the individual topics.
+
+Provide:
+{format_subqueries(SHARED_SUBQUERIES)}
+
+Use clear sections and bullet points. Avoid using markdown symbols like # ** in your response."""
+                shared_background = model.generate_content(background_prompt).text
+                
+                status_text.success("✅ Shared Background Complete!")
+                
+                with st.expander("📄 View Shared Background", expanded=True):
+                    st.markdown(shared_background)
+                
+            except Exception as e:
+                st.error(f"❌ Error: {str(e)}")
+                st.stop()
+    
+    # ===== TOPIC RESEARCH & ANALYSIS PHASE =====
+    with tab2:
+        st.subheader("🔍 Topic Research & Analysis")
+        status_text2 = st.empty()
+        status_text2.info(f"🔄 Running Research and Analysis Agents for {len(topics)} topics in parallel...")
+        
+        with st.spinner("📊 Agents processing topic-specific insights..."):
+            try:
+                progress_bar2 = st.progress(0)
+                with ThreadPoolExecutor(max_workers=len(topics)) as executor:
+                    futures = {
+                        executor.submit(run_topic_pipeline, model, topic, topics): topic
+                        for topic in topics
+                    }
+                    for done, future in enumerate(as_completed(futures), 1):
+                        topic_results[futures[future]] = future.result()
+                        progress_bar2.progress(int(done / len(topics) * 100))
+                
+                status_text2.success("✅ Topic Research & Analysis Complete!")
+                
+                for topic in topics:
+                    research, analysis = topic_results[topic]
+                    with st.expander(f"📄 {topic}"):
+                        st.markdown("**Research**")
+                        st.markdown(research)
+                        st.markdown("**Analysis**")
+                        st.markdown(analysis)
+                
+            except Exception as e:
+                st.error(f"❌ Error: {str(e)}")
+                st.stop()
+    
+    # ===== COMPARATIVE WRITING PHASE =====
+    with tab3:
+        st.subheader("✍️ Comparative Report")
+        status_text3 = st.empty()
+        status_text3.info("🔄 Initializing Writer Agent...")
+        
+        with st.spinner("✍️ Writer Agent creating comparative report..."):
+            try:
+                topic_context = "\n\n".join(
+                    f"Topic: {topic}\n\nResearch:\n{topic_results[topic][0]}\n\nAnalysis:\n{topic_results[topic][1]}"
+                    for topic in topics
+                )
+                writer_prompt = f"""You are a Professional Writer. Create a comparative report on: {topic_list}
+
+Structure:
+1. **Executive Summary** (3-4 paragraphs)
+2. **Shared Market Background** (Context common to all topics)
+3. **Topic Profiles** (One section per topic)
+4. **Side-by-Side Comparison** (A markdown table of key criteria)
+5. **Strengths & Weaknesses** (Per topic)
+6. **Recommendations** (Which topic fits which situation)
+7. **Conclusion** (Future outlook)
+8. **References** (Sources)
+
+Use professional language, proper formatting, and include specific data points.
+
+Shared Background:
+{shared_background}
+
+{topic_context}"""
+                comparative_report = model.generate_content(writer_prompt).text
+                
+                status_text3.success("✅ Report Generated!")
+                
+                st.markdown(comparative_report)
+                
+                # Download Section
+                st.subheader("💾 Download Options")
+                col1, col2, col3 = st.columns(3)
+                file_stem = "_vs_".join(topic.replace(' ', '_') for topic in topics)
+                
+                col1.download_button(
+                    "📄 Markdown Format",
+                    data=comparative_report,
+                    file_name=f"{file_stem}.md",
+                    mime="text/markdown",
+                    use_container_width=True
+                )
+                
+                col2.download_button(
+                    "📝 Text Format",
+                    data=comparative_report,
+                    file_name=f"{file_stem}.txt",
+                    mime="text/plain",
+                    use_container_width=True
+                )
+                
+                col3.button("📊 PDF Export (Soon)", disabled=True, use_container_width=True)
+                
+            except Exception as e:
+                st.error(f"❌ Error: {str(e)}")
+                st.stop()
+    
+    # ===== MARKET TRENDS TAB =====
+    with tab4:
+        if show_viz:
+            st.subheader("📈 Market Trend Analysis")
+            
+            # Topics that produce the same charts share one chart group
+            chart_groups = {}
+            for topic in topics:
+                category = detect_category(topic)
+                if category not in CHART_CATEGORIES:
+                    category = 'general'
+                chart_groups.setdefault(category, []).append(topic)
+            
+            st.info(f"📊 Categories: **{', '.join(c.title() for c in chart_groups)}** | Showing Real-Time Market Trends")
+            
+            with st.container(border=True):
+                for category, group_topics in chart_groups.items():
+                    st.markdown(f"### 📂 {category.title()}: {', '.join(group_topics)}")
+                    charts = create_market_trends(category, ', '.join(group_topics))
+                    for idx, (title, chart) in enumerate(charts):
+                        st.subheader(title)
+                        st.plotly_chart(chart, use_container_width=True, key=f"compare_{category}_{idx}")
+                        st.markdown("---")
+                
+                # Keyword chart
+                all_text = shared_background + " " + " ".join(
+                    research + " " + analysis for research, analysis in topic_results.values()
+                )
+                keyword_fig = generate_keyword_chart(all_text)
+                if keyword_fig:
+                    st.plotly_chart(keyword_fig, use_container_width=True, key="compare_keywords")
+                
+                # Overall stats
+                st.subheader("📊 Report Statistics")
+                col1, col2, col3 = st.columns(3)
+                
+                col1.metric("Topics Compared", len(topics))
+                col2.metric("Total Words", len(comparative_report.split()))
+                col3.metric("Background Words", len(shared_background.split()), help="Researched once and passed only to the Writer Agent")
+        
+        else:
+            st.info("📊 Enable 'Show Analytics' checkbox to view comprehensive market trends and visualizations")
+    
+    # Final Success
+    st.success("🎉 **All Agents Completed Successfully!** Your comparative research report is ready.")
+
+# ===== SINGLE TOPIC RESEARCH =====
+elif start_research:
     if not research_topic or research_topic.strip() == "":
         st.error("⚠️ Please enter a research topic!")
         st.stop()